@@ -0,0 +1,189 @@
+"""Microbenchmarks for utils.indicators against the pandas equivalents.
+
+Run from the repository root:
+
+    python -m benchmarks.indicators_bench --bars 100000
+
+Each row shows the best batch time of the NumPy kernel and of the pandas
+rolling / ewm equivalent, the per-update cost of the streaming state, and the
+largest difference between the batch and streaming results relative to the
+largest value of the indicator, over every output of the indicator. SMA and
+Bollinger Bands are also checked against their pandas values (``ref diff``),
+which use the same definitions. The run fails if any difference is above
+``--rtol``.
+"""
+
+import argparse
+import math
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from utils import indicators
+
+
+def pandas_rsi(close, period):
+    changes = close.diff()
+    gains = changes.clip(lower=0)
+    losses = -changes.clip(upper=0)
+    avg_gain = gains.ewm(alpha=1 / period, adjust=False).mean()
+    avg_loss = losses.ewm(alpha=1 / period, adjust=False).mean()
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def pandas_bollinger(close, period, num_std):
+    middle = close.rolling(period).mean()
+    deviation = close.rolling(period).std(ddof=0)
+    return middle + num_std * deviation, middle, middle - num_std * deviation
+
+
+def pandas_macd(close, fast, slow, signal):
+    macd_line = (
+        close.ewm(span=fast, adjust=False).mean()
+        - close.ewm(span=slow, adjust=False).mean()
+    )
+    signal_line = macd_line.ewm(span=signal, adjust=False).mean()
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def pandas_atr(high, low, close, period):
+    previous_close = close.shift()
+    ranges = pd.concat(
+        [high - low, (high - previous_close).abs(), (low - previous_close).abs()],
+        axis=1,
+    ).max(axis=1)
+    return ranges.ewm(alpha=1 / period, adjust=False).mean()
+
+
+def outputs(result):
+    """Return every output of an indicator as a tuple of float arrays."""
+    if isinstance(result, tuple):
+        return tuple(np.asarray(output, dtype=float) for output in result)
+    return (np.asarray(result, dtype=float),)
+
+
+def best_time(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def stream(state, columns):
+    values = np.array([state.update(*row) for row in zip(*columns)], dtype=float)
+    return tuple(values.reshape(len(values), -1).T)
+
+
+def relative_difference(expected, actual):
+    """Largest relative difference over every output of two indicator results."""
+    expected, actual = outputs(expected), outputs(actual)
+    if len(expected) != len(actual):
+        return math.inf
+    differences = []
+    for want, got in zip(expected, actual):
+        if not np.array_equal(np.isnan(want), np.isnan(got)):
+            return math.inf  # The warm-up periods differ
+        mask = ~np.isnan(want)
+        if mask.any():
+            scale = max(float(np.max(np.abs(want[mask]))), 1e-12)
+            differences.append(float(np.max(np.abs(want[mask] - got[mask]))) / scale)
+    return max(differences, default=math.nan)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bars", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--rtol",
+        type=float,
+        default=1e-9,
+        help="Maximum relative batch/stream difference (default 1e-9).",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    close = 60_000 * np.exp(np.cumsum(rng.normal(0, 0.002, args.bars)))
+    high = close * (1 + np.abs(rng.normal(0, 0.001, args.bars)))
+    low = close * (1 - np.abs(rng.normal(0, 0.001, args.bars)))
+    close_s, high_s, low_s = pd.Series(close), pd.Series(high), pd.Series(low)
+
+    cases = [
+        (
+            "SMA(45)",
+            lambda: indicators.sma(close, 45),
+            lambda: close_s.rolling(45).mean(),
+            lambda: indicators.SMAStream(45),
+            [close],
+            True,
+        ),
+        (
+            "EMA(12)",
+            lambda: indicators.ema(close, 12),
+            lambda: close_s.ewm(span=12, adjust=False).mean(),
+            lambda: indicators.EMAStream(12),
+            [close],
+            False,
+        ),
+        (
+            "RSI(14)",
+            lambda: indicators.rsi(close, 14),
+            lambda: pandas_rsi(close_s, 14),
+            lambda: indicators.RSIStream(14),
+            [close],
+            False,
+        ),
+        (
+            "BBANDS(20)",
+            lambda: indicators.bollinger_bands(close, 20),
+            lambda: pandas_bollinger(close_s, 20, 2.0),
+            lambda: indicators.BollingerStream(20),
+            [close],
+            True,
+        ),
+        (
+            "MACD(12,26,9)",
+            lambda: indicators.macd(close),
+            lambda: pandas_macd(close_s, 12, 26, 9),
+            lambda: indicators.MACDStream(),
+            [close],
+            False,
+        ),
+        (
+            "ATR(14)",
+            lambda: indicators.atr(high, low, close, 14),
+            lambda: pandas_atr(high_s, low_s, close_s, 14),
+            lambda: indicators.ATRStream(14),
+            [high, low, close],
+            False,
+        ),
+    ]
+
+    print(f"{args.bars} bars, best of {args.repeat}")
+    print(
+        f"{'indicator':<15}{'numpy ms':>10}{'pandas ms':>11}"
+        f"{'stream us/bar':>15}{'rel diff':>12}{'ref diff':>12}"
+    )
+    failed = []
+    for name, batch, reference, make_state, columns, check_reference in cases:
+        numpy_time = best_time(batch, args.repeat)
+        pandas_time = best_time(reference, args.repeat)
+        stream_time = best_time(lambda: stream(make_state(), columns), 1)
+        difference = relative_difference(batch(), stream(make_state(), columns))
+        reference_difference = (
+            relative_difference(reference(), batch()) if check_reference else math.nan
+        )
+        if not difference <= args.rtol or reference_difference > args.rtol:
+            failed.append(name)
+        print(
+            f"{name:<15}{numpy_time * 1e3:>10.2f}{pandas_time * 1e3:>11.2f}"
+            f"{stream_time / args.bars * 1e6:>15.2f}{difference:>12.1e}"
+            f"{reference_difference:>12.1e}"
+        )
+
+    if failed:
+        print(f"Results differ by more than {args.rtol}: {failed}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
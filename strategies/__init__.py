@@ -0,0 +1,26 @@
+# __init__.py inside 'strategies' folder
+
+import importlib
+
+# Strategy modules import ccxt (and pandas), so the main classes are loaded
+# lazily on first access instead of when the package itself is imported
+_lazy_imports = {
+    "TradingDepthStrategy": ".depth",
+    "SwingTradingStrategy": ".swing",
+    "SwingSignalScanner": ".scanner",
+}
+
+# If you have other strategies, register them as well
+# "DynamicMarketMaker": ".mm_dynamic",
+# "OtherStrategy": ".mm_other_strategy",
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        module = importlib.import_module(_lazy_imports[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Define what gets imported when someone does 'from strategies import *'
+__all__ = ['TradingDepthStrategy', 'SwingTradingStrategy', 'SwingSignalScanner']
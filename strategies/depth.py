@@ -1,7 +1,108 @@
 import ccxt
 import logging
 import json
+import math
 import time
+from collections import deque
+
+
+class RequoteScheduler:
+    """Decide when the ladder needs a requote and how long to wait between checks.
+
+    A requote is triggered when the mid price drifts more than ``band`` away from
+    the mid the ladder was quoted at, when an order has been filled or canceled,
+    or when short-term volatility jumps above ``vol_multiplier`` times its recent
+    baseline. The check interval stays at ``min_interval`` while volatility is
+    elevated; otherwise, while nothing changes, it backs off exponentially from
+    ``min_interval`` up to ``max_interval`` seconds.
+    """
+
+    REASONS = ("initial", "fill", "band", "volatility")
+
+    def __init__(
+        self,
+        band=0.005,
+        min_interval=2,
+        max_interval=30,
+        backoff=2.0,
+        vol_window=20,
+        vol_short_window=5,
+        vol_multiplier=2.0,
+    ):
+        self.band = float(band)
+        self.min_interval = float(min_interval)
+        self.max_interval = float(max_interval)
+        self.backoff = float(backoff)
+        self.vol_short_window = int(vol_short_window)
+        if not 0 < self.vol_short_window < int(vol_window):
+            raise Exception("vol_short_window must be between 0 and vol_window.")
+        self.vol_multiplier = float(vol_multiplier)
+
+        self.interval = self.min_interval
+        self.quoted_mid = None
+        self.last_mid = None
+        self.returns = deque(maxlen=int(vol_window))
+        self.vol_elevated = False
+
+        # Requote trigger counters, plus "idle" for checks that did not requote
+        self.counters = {reason: 0 for reason in self.REASONS}
+        self.counters["idle"] = 0
+
+    def evaluate(self, mid_price, filled=False):
+        """Return the reason to requote at this mid price, or None to keep the ladder."""
+        volatility_rising = self.update_volatility(mid_price)
+
+        if self.quoted_mid is None:
+            reason = "initial"
+        elif filled:
+            reason = "fill"
+        elif abs(mid_price / self.quoted_mid - 1) >= self.band:
+            reason = "band"
+        elif volatility_rising:
+            reason = "volatility"
+        else:
+            reason = None
+
+        if reason:
+            self.counters[reason] += 1
+            self.interval = self.min_interval
+        else:
+            self.counters["idle"] += 1
+            if self.vol_elevated:
+                # The market is still moving, keep checking at the fastest rate
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.interval * self.backoff, self.max_interval)
+        return reason
+
+    def mark_quoted(self, mid_price):
+        """Remember the mid price the current ladder was placed around."""
+        self.quoted_mid = mid_price
+
+    def update_volatility(self, mid_price):
+        """Record a mid price sample; return True when volatility has just risen."""
+        if self.last_mid:
+            # Normalize by the time slept so samples taken at different
+            # back-off intervals are comparable
+            log_return = math.log(mid_price / self.last_mid)
+            self.returns.append(log_return / math.sqrt(self.interval))
+        self.last_mid = mid_price
+
+        if len(self.returns) < self.returns.maxlen:
+            return False
+
+        # Compare the most recent returns against the older part of the window
+        returns = list(self.returns)
+        recent = returns[-self.vol_short_window :]
+        older = returns[: -self.vol_short_window]
+        short_vol = math.sqrt(sum(r * r for r in recent) / len(recent))
+        baseline_vol = math.sqrt(sum(r * r for r in older) / len(older))
+
+        elevated = baseline_vol > 0 and short_vol > baseline_vol * self.vol_multiplier
+        # Only trigger on the transition into a volatile regime
+        rising = elevated and not self.vol_elevated
+        self.vol_elevated = elevated
+        return rising
 
 
 class TradingDepthStrategy:
@@ -13,6 +114,7 @@ class TradingDepthStrategy:
         config_path,
         base_order_amount=0,
         order_levels=3,
+        exchange=None,
     ):
         logging.info("=" * 50)
         logging.info("Initializing Limit Order Market Maker bot...")
@@ -31,8 +133,8 @@ class TradingDepthStrategy:
         self.max_spread = 0.02  # 2% total spread
         self.spread_per_level = self.max_spread / self.order_levels
 
-        # Initialize exchange via ccxt
-        self.exchange = self.initialize_exchange()
+        # Initialize exchange via ccxt, unless one is injected (e.g. a replay)
+        self.exchange = exchange or self.initialize_exchange()
         self.trading_pair = self.config["bot"]["trading_pair"]
 
         self.base_asset = self.trading_pair.split("/")[0]  # e.g., TOAD
@@ -41,6 +143,10 @@ class TradingDepthStrategy:
         # Store active orders
         self.active_orders = []
 
+        # Requote scheduling, tunable via the bot's "requote" parameters
+        requote_params = self.config["bot"].get("parameters", {}).get("requote", {})
+        self.scheduler = RequoteScheduler(**requote_params)
+
     def show_balance(self):
         balance = self.exchange.fetch_balance()
         logging.info(
@@ -127,8 +233,9 @@ class TradingDepthStrategy:
         quote_balance = balance[self.quote_asset]["free"]  # Free balance of quote asset
         return base_balance, quote_balance
 
-    def place_limit_orders(self):
-        mid_price = self.get_market_data()
+    def place_limit_orders(self, mid_price=None):
+        if mid_price is None:
+            mid_price = self.get_market_data()
 
         # Calculate the spread per level to stay within ±2%
         spread_per_level = self.max_spread / self.order_levels
@@ -212,37 +319,49 @@ class TradingDepthStrategy:
             except Exception as e:
                 logging.error(f"Failed to place sell order at level {level}: {e}")
 
-    def check_and_replace_orders(self):
+    def sync_active_orders(self):
+        """Drop orders that are no longer open; return True if any of them disappeared."""
         # Fetch open orders from the exchange
         open_orders = self.exchange.fetch_open_orders(self.trading_pair)
-        open_order_ids = [order["id"] for order in open_orders]
+        open_order_ids = {order["id"] for order in open_orders}
 
-        # Remove orders that are no longer open from active_orders
+        # Remove orders that are no longer open from active_orders. A ladder
+        # that could only be placed partly is not a fill.
+        tracked_ids = {order["id"] for order in self.active_orders}
         self.active_orders = [
             order for order in self.active_orders if order["id"] in open_order_ids
         ]
+        return bool(tracked_ids - open_order_ids)
+
+    def run_cycle(self):
+        """Check the market once and requote the ladder if the scheduler asks for it."""
+        mid_price = self.get_market_data()
+        filled = self.sync_active_orders()
 
-        # If any orders have been filled or canceled, replace them
-        if len(self.active_orders) < self.order_levels * 2:
-            logging.info("Some orders have been filled or canceled. Replacing orders.")
+        reason = self.scheduler.evaluate(mid_price, filled)
+        if reason:
+            logging.info(f"Requoting ({reason}) around mid price {mid_price:.6f}")
             # Clear remaining orders before placing new ones
             self.clear_orders()
-            self.place_limit_orders()
+            self.place_limit_orders(mid_price)
+            self.scheduler.mark_quoted(mid_price)
+        return reason
 
     def run(self):
         while True:
             try:
-                if not self.active_orders:
-                    self.place_limit_orders()  # Place initial orders if none exist
-
-                # Check and replace orders
-                self.check_and_replace_orders()
-                time.sleep(30)  # Adjust timing as needed
+                self.run_cycle()
+                logging.info(f"Requote triggers: {self.scheduler.counters}")
+                logging.info(f"Next check in {self.scheduler.interval:.1f}s")
+                time.sleep(self.scheduler.interval)
                 logging.info("=" * 50)
                 logging.info("Running next iteration...\n")
             except Exception as e:
                 logging.error(f"Error in running bot: {e}")
-                time.sleep(30)
+                # Keep the scheduler's interval in step with the time actually
+                # slept, the next volatility sample is normalized by it
+                self.scheduler.interval = self.scheduler.max_interval
+                time.sleep(self.scheduler.interval)
 
 
 if __name__ == "__main__":
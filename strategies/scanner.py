@@ -0,0 +1,207 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from strategies.swing import SwingTradingStrategy
+
+BAR_SECONDS = 15 * 60
+# Reload markets this often so listings and delistings are picked up
+MARKETS_TTL_SECONDS = 60 * 60
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every request the scanner makes."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst or rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, cost=1):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= cost:
+                    self.tokens -= cost
+                    return
+                wait = (cost - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class SwingSignalScanner(SwingTradingStrategy):
+    """Evaluate the swing signals across many futures symbols per 15m close.
+
+    Candles are fetched concurrently by a thread pool, in batches of
+    ``batch_size`` symbols, under one shared rate limit of ``rate_limit``
+    requests per second. Positions for all symbols come from a single
+    position snapshot per scan. Orders are sized as ``order_notional`` in the
+    quote currency, since one base amount does not fit every symbol.
+    """
+
+    def __init__(
+        self,
+        symbols=None,
+        max_symbols=None,
+        batch_size=50,
+        workers=8,
+        rate_limit=10,
+        order_notional=0,
+        test_mode=True,
+    ):
+        super().__init__(test_mode=test_mode)
+        # Requests are throttled by the shared limiter instead of per call
+        self.exchange.enableRateLimit = False
+        self.rate_limiter = RateLimiter(rate_limit)
+
+        self.requested_symbols = list(symbols or [])
+        self.symbols = []
+        self.markets_loaded_at = None
+        self.max_symbols = max_symbols
+        self.batch_size = int(batch_size)
+        self.workers = int(workers)
+        self.order_notional = float(order_notional)
+
+        if not self.test_mode and self.order_notional <= 0:
+            raise Exception("order_notional must be greater than 0 for live scanning.")
+
+    def refresh_markets(self):
+        """Load markets once before fetching, and reload them every MARKETS_TTL_SECONDS.
+
+        This runs before the thread pool starts, so workers never trigger
+        ccxt's lazy load_markets concurrently and outside the rate limiter.
+        """
+        now = time.monotonic()
+        if (
+            self.markets_loaded_at is not None
+            and now - self.markets_loaded_at < MARKETS_TTL_SECONDS
+        ):
+            return
+        # load_markets makes one exchangeInfo request per market type; nothing
+        # else runs yet, so ccxt's own throttle spaces them by endpoint weight
+        self.exchange.enableRateLimit = True
+        try:
+            markets = self.exchange.load_markets(reload=self.markets_loaded_at is not None)
+        finally:
+            self.exchange.enableRateLimit = False
+        self.markets_loaded_at = now
+        self.symbols = self.load_symbols(markets)
+        logging.info(f"Scanning {len(self.symbols)} symbols.")
+
+    @staticmethod
+    def is_scannable(market):
+        """Return True for an active USDT-margined perpetual market."""
+        return bool(
+            market.get("swap")
+            and market.get("linear")
+            and market.get("quote") == "USDT"
+            and market.get("active", True)
+        )
+
+    def load_symbols(self, markets):
+        """Return the requested symbols, or every scannable one, up to max_symbols."""
+        if self.requested_symbols:
+            symbols = []
+            for symbol in self.requested_symbols:
+                if symbol in markets and self.is_scannable(markets[symbol]):
+                    symbols.append(symbol)
+                else:
+                    logging.warning(
+                        f"Skipping {symbol}: not an active USDT-margined perpetual."
+                    )
+        else:
+            symbols = sorted(
+                market["symbol"]
+                for market in markets.values()
+                if self.is_scannable(market)
+            )
+        if self.max_symbols:
+            symbols = symbols[: self.max_symbols]
+        return symbols
+
+    def fetch_symbol_candles(self, symbol):
+        self.rate_limiter.acquire()
+        return self.fetch_candles(symbol=symbol)
+
+    def evaluate_symbol(self, symbol, df, positions):
+        """Return (signal, latest close) for one symbol, or None without enough data."""
+        if df.empty:
+            return None
+        df_45m = self.compute_indicators(self.resample_45m(df))
+        if not self.indicators_ready(df_45m):
+            return None
+        position_amt = positions.get(self.market_id(symbol), 0.0)
+        return self.evaluate_signal(df_45m, position_amt), df_45m["close"].iloc[-1]
+
+    def scan(self):
+        """Scan every symbol once and act on the signals found."""
+        start = time.perf_counter()
+        self.refresh_markets()
+
+        # One position snapshot covers every symbol in this scan
+        try:
+            self.rate_limiter.acquire()
+            positions = self.fetch_position_snapshot()
+        except Exception as e:
+            logging.error(f"Error fetching position snapshot: {e}")
+            if not self.test_mode:
+                return {}
+            # Signals only need positions to filter entries, like get_current_position
+            positions = {}
+
+        signals = {}
+        failed = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for batch_start in range(0, len(self.symbols), self.batch_size):
+                batch = self.symbols[batch_start : batch_start + self.batch_size]
+                # Results arrive in order while the rest of the batch is fetched
+                for symbol, df in zip(batch, pool.map(self.fetch_symbol_candles, batch)):
+                    if df.empty:
+                        failed += 1
+                    result = self.evaluate_symbol(symbol, df, positions)
+                    if result and result[0]:
+                        signals[symbol] = result
+
+        for symbol, (signal, price) in signals.items():
+            logging.info(f"Signal to {signal.capitalize()} {symbol} at {price}.")
+            if self.test_mode:
+                logging.info(f"Test Mode: {signal} order simulated.")
+            else:
+                self.rate_limiter.acquire()
+                self.place_order(signal, self.order_notional / price, symbol=symbol)
+
+        elapsed = time.perf_counter() - start
+        logging.info(
+            f"Scanned {len(self.symbols)} symbols in {elapsed:.1f}s: "
+            f"{len(signals)} signals, {failed} failed fetches."
+        )
+        if elapsed > BAR_SECONDS / 3:
+            logging.warning(
+                f"Scan took {elapsed:.1f}s, over a third of the {BAR_SECONDS}s bar. "
+                "Raise the rate limit or workers, or scan fewer symbols."
+            )
+        return signals
+
+    def run(self):
+        """Main loop: scan the universe once per 15-minute bar, right after its open."""
+        scanned_bar = None
+        while True:
+            bar = int(time.time() // BAR_SECONDS)
+            if bar != scanned_bar:
+                # Mark the bar first so a failed scan, which may already have
+                # placed orders, is not repeated on the same bar
+                scanned_bar = bar
+                try:
+                    self.scan()
+                except Exception as e:
+                    logging.error(f"Error in scanner loop: {e}")
+
+            sleep_seconds = (bar + 1) * BAR_SECONDS - time.time()
+            logging.info(f"Sleeping {sleep_seconds:.0f}s until the next bar.")
+            time.sleep(max(sleep_seconds, 0))
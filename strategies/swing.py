@@ -5,7 +5,8 @@ import pandas as pd
 import numpy as np
 import ccxt
 from dotenv import load_dotenv
-from ta.trend import MACD
+
+from utils.indicators import bollinger_bands, rsi, sma
 
 # Load environment variables
 load_dotenv()
@@ -37,11 +38,11 @@ class SwingTradingStrategy:
             f"Initialized TradingBot for {self.trading_pair} with position size {self.position_size}"
         )
 
-    def fetch_candles(self, since=None):
+    def fetch_candles(self, since=None, symbol=None):
         """Fetch 15-minute candlestick (OHLCV) data for the trading pair."""
         try:
             candles = self.exchange.fetch_ohlcv(
-                self.trading_pair, timeframe="15m", limit=200, since=since
+                symbol or self.trading_pair, timeframe="15m", limit=200, since=since
             )
             df = pd.DataFrame(
                 candles, columns=["timestamp", "open", "high", "low", "close", "volume"]
@@ -56,7 +57,7 @@ class SwingTradingStrategy:
         """Resample to 45 minutes by combining three 15-minute periods."""
         df.set_index("timestamp", inplace=True)
         df_45m = (
-            df.resample("45T")
+            df.resample("45min")
             .agg(
                 {
                     "open": "first",
@@ -72,33 +73,44 @@ class SwingTradingStrategy:
 
     def compute_indicators(self, df):
         """Compute technical indicators."""
-        df["SMA_45m"] = MACD.SMA(df["close"], timeperiod=45)
-        df["RSI"] = MACD.RSI(df["close"], timeperiod=14)
-        df["upper_band"], df["middle_band"], df["lower_band"] = talib.BBANDS(
-            df["close"], timeperiod=20
+        close = df["close"].to_numpy(dtype=float)
+        df["SMA_45m"] = sma(close, 45)
+        df["RSI"] = rsi(close, 14)
+        df["upper_band"], df["middle_band"], df["lower_band"] = bollinger_bands(
+            close, 20
         )
         return df
 
+    def market_id(self, symbol):
+        """Return the exchange's id for a symbol, e.g. BTC/USDT:USDT -> BTCUSDT."""
+        markets = self.exchange.markets or {}
+        if symbol in markets:
+            return markets[symbol]["id"]
+        return symbol.split(":")[0].replace("/", "")
+
+    def fetch_position_snapshot(self):
+        """Fetch the position amounts of every symbol with a single request."""
+        positions = self.exchange.fapiPrivateGetPositionRisk()
+        return {
+            position["symbol"]: float(position["positionAmt"]) for position in positions
+        }
+
     def get_current_position(self):
         """Check if there is an existing open position."""
         try:
-            positions = self.exchange.fapiPrivateGetPositionRisk()
-            for position in positions:
-                if position["symbol"] == self.trading_pair.replace("/", ""):
-                    position_amt = float(position["positionAmt"])
-                    return position_amt
-            return 0.0
+            positions = self.fetch_position_snapshot()
+            return positions.get(self.market_id(self.trading_pair), 0.0)
         except Exception as e:
             logging.error(f"Error fetching current position: {e}")
             return 0.0
 
-    def place_order(self, side, amount, price=None):
+    def place_order(self, side, amount, price=None, symbol=None):
         """Place a limit or market order on Binance Futures."""
         try:
             order_type = "limit" if price else "market"
             params = {"timeInForce": "GTC"} if price else {}
             order = self.exchange.create_order(
-                symbol=self.trading_pair,
+                symbol=symbol or self.trading_pair,
                 type=order_type,
                 side=side,
                 amount=amount,
@@ -109,9 +121,28 @@ class SwingTradingStrategy:
         except Exception as e:
             logging.error(f"Error placing order: {e}")
 
+    def indicators_ready(self, df):
+        """Check that the latest bar has the indicators the signals need."""
+        return not (
+            df.empty or "SMA_45m" not in df.columns or np.isnan(df["SMA_45m"].iloc[-1])
+        )
+
+    def evaluate_signal(self, df, position_amt):
+        """Return "buy", "sell" or None for the latest bar and the current position."""
+        current_price = df["close"].iloc[-1]
+        sma_45m = df["SMA_45m"].iloc[-1]
+
+        # Buy if the current price is 5% below the 45-minute SMA and no existing long position
+        if current_price < sma_45m * 0.95 and position_amt >= 0:
+            return "buy"
+        # Sell if the current price is 5% above the 45-minute SMA and no existing short position
+        if current_price > sma_45m * 1.05 and position_amt <= 0:
+            return "sell"
+        return None
+
     def execute_strategy(self, df):
         """Execute the trading strategy based on technical indicators."""
-        if df.empty or "SMA_45m" not in df.columns or np.isnan(df["SMA_45m"].iloc[-1]):
+        if not self.indicators_ready(df):
             logging.warning("Insufficient data to compute indicators.")
             return
 
@@ -123,16 +154,15 @@ class SwingTradingStrategy:
         position_amt = self.get_current_position()
         logging.info(f"Current Position Amount: {position_amt}")
 
-        # Buy if the current price is 5% below the 45-minute SMA and no existing long position
-        if current_price < sma_45m * 0.95 and position_amt >= 0:
+        signal = self.evaluate_signal(df, position_amt)
+        if signal == "buy":
             logging.info("Signal to Buy.")
             if self.test_mode:
                 logging.info("Test Mode: Buy order simulated.")
             else:
                 self.place_order("buy", self.position_size)
 
-        # Sell if the current price is 5% above the 45-minute SMA and no existing short position
-        elif current_price > sma_45m * 1.05 and position_amt <= 0:
+        elif signal == "sell":
             logging.info("Signal to Sell.")
             if self.test_mode:
                 logging.info("Test Mode: Sell order simulated.")
@@ -179,6 +209,14 @@ class SwingTradingStrategy:
 
         logging.info("Backtest completed.")
 
+    def sleep_until_next_bar(self):
+        """Sleep until the next 15-minute interval."""
+        current_minute = pd.Timestamp.utcnow().minute
+        sleep_minutes = (15 - (current_minute % 15)) % 15
+        sleep_seconds = sleep_minutes * 60 - pd.Timestamp.utcnow().second
+        logging.info(f"Sleeping for {sleep_minutes} minutes.")
+        time.sleep(sleep_seconds if sleep_seconds > 0 else 60)
+
     def run(self):
         """Main loop to run the trading bot."""
         while True:
@@ -187,19 +225,15 @@ class SwingTradingStrategy:
                 df_45m = self.resample_45m(df)
                 df_45m = self.compute_indicators(df_45m)
                 self.execute_strategy(df_45m)
-
-                # Sleep until the next 15-minute interval
-                current_minute = pd.Timestamp.utcnow().minute
-                sleep_minutes = (15 - (current_minute % 15)) % 15
-                sleep_seconds = sleep_minutes * 60 - pd.Timestamp.utcnow().second
-                logging.info(f"Sleeping for {sleep_minutes} minutes.")
-                time.sleep(sleep_seconds if sleep_seconds > 0 else 60)
+                self.sleep_until_next_bar()
             except Exception as e:
                 logging.error(f"Error in main loop: {e}")
                 time.sleep(60)  # Sleep for 1 minute before retrying
 
 
 if __name__ == "__main__":
+    # Run from the repository root with `python -m strategies.swing` so the
+    # utils package is importable, or use `python main.py backtest`
     # Get trading pair from user input
     trading_pair_input = input("Enter the trading pair (e.g., BTC/USDT): ").strip()
     trading_pair = trading_pair_input.upper() if trading_pair_input else "BTC/USDT"
@@ -1,11 +0,0 @@
-# __init__.py inside 'utils' folder
-
-# Import the main classes or functions from your utility modules
-from .order_book import OrderBookUtils
-
-# If you have other utility modules, import them as needed
-# from .data_processing import DataProcessor
-# from .api_helpers import APIHelper
-
-# Define what gets imported when someone does 'from utils import *'
-__all__ = ["OrderBookUtils"]
@@ -0,0 +1,27 @@
+# __init__.py inside 'utils' folder
+
+import importlib
+
+# Utility modules import ccxt, so the main classes are loaded lazily on first
+# access instead of when the package itself is imported
+_lazy_imports = {
+    "OrderBookUtils": ".order_book",
+    "RecordingExchange": ".replay",
+    "ReplayExchange": ".replay",
+    "replay_session": ".replay",
+}
+
+# If you have other utility modules, register them as needed
+# "DataProcessor": ".data_processing",
+# "APIHelper": ".api_helpers",
+
+
+def __getattr__(name):
+    if name in _lazy_imports:
+        module = importlib.import_module(_lazy_imports[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Define what gets imported when someone does 'from utils import *'
+__all__ = ["OrderBookUtils", "RecordingExchange", "ReplayExchange", "replay_session"]
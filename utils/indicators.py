@@ -0,0 +1,324 @@
+"""Technical indicators as NumPy batch functions and O(1) streaming states.
+
+The batch functions take whole price arrays and are meant for backtests; the
+values before an indicator has enough data are NaN. The streaming classes are
+fed one bar at a time in the live loop and keep only the state they need.
+Both follow the TA-Lib conventions (EMAs seeded with the SMA of the first
+``period`` values, Wilder smoothing for RSI and ATR, population standard
+deviation for Bollinger Bands) and agree to a relative tolerance of 1e-9,
+which ``benchmarks/indicators_bench.py`` checks.
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+
+
+def _as_array(values):
+    return np.asarray(values, dtype=float)
+
+
+def _ema_recursion(values, alpha, initial):
+    """Evaluate y[i] = (1 - alpha) * y[i - 1] + alpha * values[i] without a Python loop.
+
+    NumPy has no compiled scan for this recursion, so it is solved in closed
+    form: y = decay * (initial + cumsum(alpha * values / decay)) with
+    decay[i] = (1 - alpha) ** (i + 1). The decay factors underflow on long
+    inputs, so the series is processed in chunks over which they stay above
+    1e-100. The factors are computed once and reused for every chunk, and the
+    work is done in place to keep it to a few passes over memory.
+    """
+    if alpha >= 1:
+        return values.copy()
+
+    decay_rate = 1 - alpha
+    chunk = max(1, int(100 * math.log(10) / -math.log(decay_rate)))
+    chunk = min(chunk, len(values))
+    decay = decay_rate ** np.arange(1, chunk + 1)
+    scale = alpha / decay
+
+    result = np.empty_like(values)
+    previous = initial
+    for start in range(0, len(values), chunk):
+        size = min(chunk, len(values) - start)
+        window = result[start : start + size]
+        np.multiply(values[start : start + size], scale[:size], out=window)
+        np.cumsum(window, out=window)
+        window += previous
+        window *= decay[:size]
+        previous = window[-1]
+    return result
+
+
+def _rolling_moments(values, period, with_variance=True, block=4096):
+    """Rolling mean and population variance in O(n).
+
+    Windows are summed with cumulative sums of x and x**2. Each block of
+    windows is centred on its own mean first, so the sums stay small and
+    subtracting them does not lose precision on trending prices.
+    """
+    mean = np.full(len(values), np.nan)
+    variance = np.full(len(values), np.nan) if with_variance else None
+    sums = np.zeros(block + period)
+    squares = np.zeros(block + period)
+    for start in range(period - 1, len(values), block):
+        stop = min(start + block, len(values))
+        count = stop - start
+        segment = values[start - period + 1 : stop]
+        reference = segment.mean()
+        centred = segment - reference
+
+        # sums[0] stays 0, so window sums are differences of the cumulative sums
+        np.cumsum(centred, out=sums[1 : count + period])
+        window_mean = sums[period : count + period] - sums[:count]
+        window_mean /= period
+        mean[start:stop] = window_mean + reference
+
+        if with_variance:
+            centred *= centred
+            np.cumsum(centred, out=squares[1 : count + period])
+            window_square = squares[period : count + period] - squares[:count]
+            window_square /= period
+            window_square -= window_mean * window_mean
+            np.maximum(window_square, 0.0, out=variance[start:stop])
+    return mean, variance
+
+
+def sma(values, period):
+    """Simple moving average."""
+    return _rolling_moments(_as_array(values), period, with_variance=False)[0]
+
+
+def ema(values, period, alpha=None):
+    """Exponential moving average seeded with the SMA of the first ``period`` values.
+
+    ``alpha`` defaults to 2 / (period + 1); pass 1 / period for Wilder smoothing.
+    Leading NaNs are skipped, so the EMA of another indicator works as expected.
+    """
+    values = _as_array(values)
+    alpha = 2 / (period + 1) if alpha is None else alpha
+    result = np.full(len(values), np.nan)
+
+    valid = np.flatnonzero(~np.isnan(values))
+    if len(valid) == 0:
+        return result
+    seed_index = valid[0] + period - 1
+    if seed_index >= len(values):
+        return result
+
+    result[seed_index] = values[valid[0] : seed_index + 1].mean()
+    result[seed_index + 1 :] = _ema_recursion(
+        values[seed_index + 1 :], alpha, result[seed_index]
+    )
+    return result
+
+
+def rsi(values, period=14):
+    """Relative strength index with Wilder smoothing."""
+    values = _as_array(values)
+    changes = np.diff(values, prepend=np.nan)
+    gains = np.where(changes > 0, changes, 0.0)
+    losses = np.where(changes < 0, -changes, 0.0)
+    gains[0] = losses[0] = np.nan
+
+    avg_gain = ema(gains, period, alpha=1 / period)
+    avg_loss = ema(losses, period, alpha=1 / period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = 100 - 100 / (1 + avg_gain / avg_loss)
+    result[(avg_loss == 0) & (avg_gain > 0)] = 100.0
+    result[(avg_loss == 0) & (avg_gain == 0)] = 50.0
+    return result
+
+
+def bollinger_bands(values, period=20, num_std=2.0):
+    """Bollinger Bands, returned as (upper, middle, lower)."""
+    middle, variance = _rolling_moments(_as_array(values), period)
+    deviation = np.sqrt(variance)
+    return middle + num_std * deviation, middle, middle - num_std * deviation
+
+
+def macd(values, fast=12, slow=26, signal=9):
+    """MACD, returned as (macd, signal, histogram)."""
+    values = _as_array(values)
+    macd_line = ema(values, fast) - ema(values, slow)
+    signal_line = ema(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def true_range(high, low, close):
+    """True range; NaN for the first bar, which has no previous close."""
+    high, low, close = _as_array(high), _as_array(low), _as_array(close)
+    previous_close = np.roll(close, 1)
+    ranges = np.maximum(
+        high - low,
+        np.maximum(np.abs(high - previous_close), np.abs(low - previous_close)),
+    )
+    if len(ranges):
+        ranges[0] = np.nan
+    return ranges
+
+
+def atr(high, low, close, period=14):
+    """Average true range with Wilder smoothing.
+
+    Like TA-Lib, it is seeded with the mean true range of bars 1 to ``period``,
+    so the first value is at index ``period``.
+    """
+    return ema(true_range(high, low, close), period, alpha=1 / period)
+
+
+class SMAStream:
+    """Streaming simple moving average.
+
+    The running total is recomputed from the window every ``period`` updates,
+    amortized O(1), so rounding errors do not accumulate over long streams.
+    """
+
+    def __init__(self, period):
+        self.period = period
+        self.window = deque(maxlen=period)
+        self.total = 0.0
+        self.count = 0
+        self.value = math.nan
+
+    def update(self, value):
+        if len(self.window) == self.period:
+            self.total -= self.window[0]
+        self.window.append(value)
+        self.total += value
+        self.count += 1
+        if self.count % self.period == 0:
+            self.total = math.fsum(self.window)
+        if len(self.window) == self.period:
+            self.value = self.total / self.period
+        return self.value
+
+
+class EMAStream:
+    """Streaming exponential moving average, seeded like :func:`ema`."""
+
+    def __init__(self, period, alpha=None):
+        self.period = period
+        self.alpha = 2 / (period + 1) if alpha is None else alpha
+        self.count = 0
+        self.seed_total = 0.0
+        self.value = math.nan
+
+    def update(self, value):
+        self.count += 1
+        if self.count < self.period:
+            self.seed_total += value
+        elif self.count == self.period:
+            self.value = (self.seed_total + value) / self.period
+        else:
+            self.value = (1 - self.alpha) * self.value + self.alpha * value
+        return self.value
+
+
+class RSIStream:
+    """Streaming relative strength index, matching :func:`rsi`."""
+
+    def __init__(self, period=14):
+        self.avg_gain = EMAStream(period, alpha=1 / period)
+        self.avg_loss = EMAStream(period, alpha=1 / period)
+        self.previous = None
+        self.value = math.nan
+
+    def update(self, value):
+        if self.previous is not None:
+            change = value - self.previous
+            avg_gain = self.avg_gain.update(max(change, 0.0))
+            avg_loss = self.avg_loss.update(max(-change, 0.0))
+            if avg_loss == 0:
+                self.value = 100.0 if avg_gain > 0 else 50.0
+            elif not math.isnan(avg_loss):
+                self.value = 100 - 100 / (1 + avg_gain / avg_loss)
+        self.previous = value
+        return self.value
+
+
+class BollingerStream:
+    """Streaming Bollinger Bands; ``update`` returns (upper, middle, lower).
+
+    The window variance is kept with a Welford-style update that swaps the
+    oldest value for the newest, avoiding the cancellation of sum of squares.
+    Mean and variance are recomputed from the window every ``period`` updates,
+    amortized O(1), so rounding errors do not accumulate over long streams.
+    """
+
+    def __init__(self, period=20, num_std=2.0):
+        self.period = period
+        self.num_std = num_std
+        self.window = deque(maxlen=period)
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.count = 0
+        self.value = (math.nan, math.nan, math.nan)
+
+    def update(self, value):
+        self.count += 1
+        if self.count % self.period == 0:
+            self.window.append(value)
+            self.mean = math.fsum(self.window) / len(self.window)
+            self.m2 = math.fsum((x - self.mean) ** 2 for x in self.window)
+        elif len(self.window) < self.period:
+            self.window.append(value)
+            delta = value - self.mean
+            self.mean += delta / len(self.window)
+            self.m2 += delta * (value - self.mean)
+        else:
+            oldest = self.window[0]
+            self.window.append(value)
+            previous_mean = self.mean
+            self.mean += (value - oldest) / self.period
+            self.m2 += (value - oldest) * (value - self.mean + oldest - previous_mean)
+
+        if len(self.window) == self.period:
+            deviation = math.sqrt(max(self.m2, 0.0) / self.period)
+            self.value = (
+                self.mean + self.num_std * deviation,
+                self.mean,
+                self.mean - self.num_std * deviation,
+            )
+        return self.value
+
+
+class MACDStream:
+    """Streaming MACD; ``update`` returns (macd, signal, histogram)."""
+
+    def __init__(self, fast=12, slow=26, signal=9):
+        self.fast = EMAStream(fast)
+        self.slow = EMAStream(slow)
+        self.signal = EMAStream(signal)
+        self.value = (math.nan, math.nan, math.nan)
+
+    def update(self, value):
+        fast = self.fast.update(value)
+        slow = self.slow.update(value)
+        if not math.isnan(slow):
+            macd_value = fast - slow
+            signal_value = self.signal.update(macd_value)
+            self.value = (macd_value, signal_value, macd_value - signal_value)
+        return self.value
+
+
+class ATRStream:
+    """Streaming average true range, matching :func:`atr`."""
+
+    def __init__(self, period=14):
+        self.average = EMAStream(period, alpha=1 / period)
+        self.previous_close = None
+        self.value = math.nan
+
+    def update(self, high, low, close):
+        # The first bar only provides the previous close
+        if self.previous_close is not None:
+            current_range = max(
+                high - low,
+                abs(high - self.previous_close),
+                abs(low - self.previous_close),
+            )
+            self.value = self.average.update(current_range)
+        self.previous_close = close
+        return self.value
@@ -0,0 +1,202 @@
+import gzip
+import json
+import logging
+import re
+import statistics
+import threading
+import time
+from collections import Counter, defaultdict, deque
+
+# Unified API calls plus implicit endpoints such as fapiPrivateGetPositionRisk
+RECORDED_METHODS = re.compile(
+    r"^(fetch_|create_|cancel_|edit_|load_markets$)|[Pp]ublic|[Pp]rivate"
+)
+
+
+def open_session(path, mode):
+    """Open a session file, gzip-compressed when the path ends with .gz."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class ReplayExhausted(Exception):
+    """Raised when the replayed session has no responses left for a call."""
+
+
+class RecordingExchange:
+    """Proxy around a ccxt exchange that records every API call to a session file.
+
+    Each call is written as one compact JSON line with its offset from the start
+    of the recording (``t``), its duration (``d``), the method name (``m``), its
+    arguments (``a``, ``k``) and either the response (``r``) or the error (``e``).
+    Everything that is not an API call is passed through untouched.
+    """
+
+    def __init__(self, exchange, path):
+        self.exchange = exchange
+        self.path = path
+        self.started_at = time.monotonic()
+        self.lock = threading.Lock()
+        self.file = open_session(path, "wt")
+        self.write({"exchange": exchange.id, "started_at": time.time()})
+        logging.info(f"Recording exchange traffic to {path}")
+
+    def __getattr__(self, name):
+        attr = getattr(self.exchange, name)
+        if not callable(attr) or not RECORDED_METHODS.search(name):
+            return attr
+
+        def recorded(*args, **kwargs):
+            start = time.monotonic()
+            record = {"t": round(start - self.started_at, 6), "m": name}
+            if args:
+                record["a"] = args
+            if kwargs:
+                record["k"] = kwargs
+            try:
+                result = attr(*args, **kwargs)
+                record["r"] = result
+                return result
+            except Exception as e:
+                record["e"] = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                record["d"] = round(time.monotonic() - start, 6)
+                self.write(record)
+
+        return recorded
+
+    def write(self, record):
+        line = json.dumps(record, separators=(",", ":"), default=str)
+        with self.lock:
+            self.file.write(line + "\n")
+            # Flush every call so a killed process loses at most the last line;
+            # a gzip session without close() also lacks its end-of-stream
+            # marker, which ReplayExchange tolerates
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+class ReplayExchange:
+    """Stand-in for a ccxt exchange that answers API calls from a recorded session.
+
+    Responses are served per method in the order they were recorded, so a code
+    version that makes fewer or more calls of one kind still gets plausible data.
+    Each response is delayed by its recorded duration divided by ``speed``; a
+    speed of 0 replays as fast as possible.
+    """
+
+    def __init__(self, path, speed=1.0):
+        self.path = path
+        self.speed = float(speed)
+        self.queues = defaultdict(deque)
+        self.calls = Counter()
+        self.exhausted = False
+
+        header = {}
+        with open_session(path, "rt") as file:
+            try:
+                header = json.loads(file.readline())
+                for line in file:
+                    if line.strip():
+                        record = json.loads(line)
+                        self.queues[record["m"]].append(record)
+            except (EOFError, json.JSONDecodeError):
+                # The recorder was killed before close(): keep every complete line
+                logging.warning(f"Session {path} is truncated, replaying what was read.")
+
+        self.id = header.get("exchange")
+        self.recorded_calls = Counter(
+            {method: len(queue) for method, queue in self.queues.items()}
+        )
+        logging.info(
+            f"Loaded {sum(self.recorded_calls.values())} recorded calls from {path}"
+        )
+
+    def __getattr__(self, name):
+        if name.startswith("_") or not RECORDED_METHODS.search(name):
+            raise AttributeError(f"Replay exchange has no attribute '{name}'.")
+
+        def replayed(*args, **kwargs):
+            return self.replay(name)
+
+        return replayed
+
+    def replay(self, method):
+        queue = self.queues.get(method)
+        if not queue:
+            self.exhausted = True
+            raise ReplayExhausted(f"No recorded responses left for '{method}'.")
+
+        record = queue.popleft()
+        self.calls[method] += 1
+        if self.speed > 0:
+            time.sleep(record.get("d", 0) / self.speed)
+        if "e" in record:
+            raise Exception(record["e"])
+        return record["r"]
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    index = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def replay_session(strategy, speed=1.0, max_cycles=None):
+    """Drive ``strategy.run_cycle`` against its ReplayExchange and report timings.
+
+    The strategy's scheduler interval is slept (divided by ``speed``) between
+    cycles but is not counted in the cycle latency. The replay ends when the
+    session runs out of responses or after ``max_cycles`` cycles.
+    """
+    exchange = strategy.exchange
+    latencies = []
+    errors = 0
+
+    while max_cycles is None or len(latencies) < max_cycles:
+        start = time.perf_counter()
+        try:
+            strategy.run_cycle()
+        except ReplayExhausted:
+            break
+        except Exception as e:
+            errors += 1
+            logging.error(f"Error in replayed cycle: {e}")
+
+        # Calls inside the strategy may swallow the exhaustion error, an
+        # incomplete cycle is not counted
+        if exchange.exhausted:
+            break
+        latencies.append(time.perf_counter() - start)
+        if speed > 0:
+            time.sleep(strategy.scheduler.interval / speed)
+
+    report = {
+        "cycles": len(latencies),
+        "errors": errors,
+        "api_calls": dict(exchange.calls),
+        "total_api_calls": sum(exchange.calls.values()),
+        "unused_responses": {
+            method: len(queue) for method, queue in exchange.queues.items() if queue
+        },
+    }
+    if latencies:
+        report.update(
+            latency_mean=statistics.fmean(latencies),
+            latency_p50=percentile(latencies, 0.5),
+            latency_p95=percentile(latencies, 0.95),
+            latency_max=max(latencies),
+            api_calls_per_cycle=report["total_api_calls"] / len(latencies),
+        )
+    if hasattr(strategy, "scheduler"):
+        report["requote_triggers"] = dict(strategy.scheduler.counters)
+
+    logging.info("=" * 50)
+    logging.info(f"Replay report for {exchange.path} at speed {speed}x:")
+    logging.info(json.dumps(report, indent=2))
+    return report